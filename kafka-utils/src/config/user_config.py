@@ -91,16 +91,17 @@ class CustomKafkaConfig(KafkaConfigABC):
         permissions = {}
         for user in self._users.values():
             permissions[user] = {}
+            user_lower = user.lower()
             for topic in self._topics.values():
                 # Базовые права для всех
                 topic_permissions = {KafkaPermissions.READ.value}
                 
                 # Если пользователь похож на продюсера
-                if 'service' in user.lower() or 'producer' in user.lower():
+                if 'service' in user_lower or 'producer' in user_lower:
                     topic_permissions.add(KafkaPermissions.WRITE.value)
                 
                 # Если пользователь похож на консьюмера
-                if 'consumer' in user.lower():
+                if 'consumer' in user_lower:
                     topic_permissions.update({
                         KafkaPermissions.AUTO_COMMIT_OFFSET.value,
                         KafkaPermissions.OFFSET_MANAGEMENT.value
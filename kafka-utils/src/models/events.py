@@ -8,7 +8,7 @@ Description:
     различные виды событий в системе.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any
 from enum import Enum
 from datetime import datetime
 from pydantic import BaseModel, Field, validator
@@ -186,11 +186,9 @@ class HealthCheck:
             await admin_client.close()
 
             # Определяем общий статус топиков
-            overall_status = HealthStatus.HEALTHY
-            if any(t["status"] == HealthStatus.UNHEALTHY for t in topics_status.values()):
-                overall_status = HealthStatus.UNHEALTHY
-            elif any(t["status"] == HealthStatus.DEGRADED for t in topics_status.values()):
-                overall_status = HealthStatus.DEGRADED
+            overall_status = self._determine_overall_status(
+                [t["status"] for t in topics_status.values()]
+            )
 
             return {
                 "status": overall_status,
@@ -252,9 +250,11 @@ class HealthCheck:
         Returns:
             HealthStatus: Общий статус здоровья.
         """
-        if any(status == HealthStatus.UNHEALTHY for status in statuses):
+        # Один проход по списку вместо отдельного any() на каждый статус
+        present = set(statuses)
+        if HealthStatus.UNHEALTHY in present:
             return HealthStatus.UNHEALTHY
-        if any(status == HealthStatus.DEGRADED for status in statuses):
+        if HealthStatus.DEGRADED in present:
             return HealthStatus.DEGRADED
         return HealthStatus.HEALTHY
 
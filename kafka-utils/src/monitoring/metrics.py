@@ -8,7 +8,7 @@ Description:
     поведение системы для оптимизации её работы.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 import time
 import logging
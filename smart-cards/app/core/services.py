@@ -5,7 +5,7 @@ Description:
 """
 
 # Стандартные библиотеки
-from typing import List, Optional
+from typing import List
 
 # Сторонние библиотеки
 from fastapi import HTTPException
@@ -5,7 +5,7 @@ Description:
 """
 
 # Сторонние библиотеки
-from pydantic import BaseModel, constr
+from pydantic import BaseModel
 from typing import Optional
 
 